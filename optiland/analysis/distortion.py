@@ -80,26 +80,35 @@ class Distortion:
             list: A list of distortion data points.
 
         """
-        Hx = be.zeros(self.num_points)
         Hy = be.linspace(1e-10, 1, self.num_points)
-
-        data = []
-        for wavelength in self.wavelengths:
-            self.optic.trace_generic(Hx=Hx, Hy=Hy, Px=0, Py=0, wavelength=wavelength)
-            yr = self.optic.surface_group.y[-1, :]
-
-            const = yr[0] / (be.tan(1e-10 * be.radians(self.optic.fields.max_field)))
-
-            if self.distortion_type == "f-tan":
-                yp = const * be.tan(Hy * be.radians(self.optic.fields.max_field))
-            elif self.distortion_type == "f-theta":
-                yp = const * Hy * be.radians(self.optic.fields.max_field)
-            else:
-                raise ValueError(
-                    '''Distortion type must be "f-tan" or
+        rad_max = be.radians(self.optic.fields.max_field)
+
+        # wavelength-independent shape of the paraxial image height
+        if self.distortion_type == "f-tan":
+            yp_shape = be.tan(Hy * rad_max) / be.tan(1e-10 * rad_max)
+        elif self.distortion_type == "f-theta":
+            yp_shape = Hy / 1e-10
+        else:
+            raise ValueError(
+                '''Distortion type must be "f-tan" or
                                  "f-theta"'''
-                )
-
-            data.append(100 * (yr - yp) / yp)
-
-        return data
+            )
+
+        # trace all wavelengths at once with a per-ray wavelength
+        num_wavelengths = len(self.wavelengths)
+        Hx = be.zeros(num_wavelengths * self.num_points)
+        wavelengths = be.repeat(be.array(self.wavelengths), self.num_points)
+        self.optic.trace_generic(
+            Hx=Hx,
+            Hy=be.tile(Hy, num_wavelengths),
+            Px=0,
+            Py=0,
+            wavelength=wavelengths,
+        )
+        yr = be.reshape(
+            self.optic.surface_group.y[-1, :],
+            (num_wavelengths, self.num_points),
+        )
+
+        yp = yr[:, :1] * yp_shape
+        return list(100 * (yr - yp) / yp)
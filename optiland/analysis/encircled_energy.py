@@ -5,8 +5,6 @@ This module provides an encircled energy analysis for optical systems.
 Kramer Harrison, 2024
 """
 
-from copy import deepcopy
-
 import matplotlib.pyplot as plt
 
 import optiland.backend as be
@@ -57,7 +55,7 @@ class EncircledEnergy(SpotDiagram):
         """
         fig, ax = plt.subplots(figsize=figsize)
 
-        data = self._center_spots(deepcopy(self.data))
+        data = self._centered_data
         geometric_size = self.geometric_spot_radius()
         axis_lim = be.max(geometric_size)
         for k, field_data in enumerate(data):
@@ -76,16 +74,11 @@ class EncircledEnergy(SpotDiagram):
         """Calculate the centroid of the Encircled Energy.
 
         Returns:
-            list: A list of tuples representing the centroid coordinates for
-                each field.
+            ndarray: The centroid coordinates (x, y) for each field, with
+                shape (num_fields, 2).
 
         """
-        centroid = []
-        for field_data in self.data:
-            centroid_x = be.mean(field_data[0][0])
-            centroid_y = be.mean(field_data[0][1])
-            centroid.append((centroid_x, centroid_y))
-        return centroid
+        return be.mean(self.data[:, 0, :2, :], axis=-1)
 
     def _plot_field(self, ax, field_data, field, axis_lim, num_points, buffer=1.2):
         """Plot the Encircled Energy curve for a specific field.
@@ -104,35 +97,24 @@ class EncircledEnergy(SpotDiagram):
         r_step = be.linspace(0, r_max, num_points)
         for points in field_data:
             x, y, energy = points
-            radii = be.sqrt(x**2 + y**2)
-
-            def vectorized_ee(r):
-                return be.nansum(energy[radii <= r])  # noqa: B023
-
-            ee = be.vectorize(vectorized_ee)(r_step)
+            radii = be.hypot(x, y)
+
+            # Sort rays by radius and accumulate energy, so that the encircled
+            # energy at each radius is a single lookup in the cumulative sum.
+            idx = be.argsort(radii)
+            radii_sorted = radii[idx]
+            energy_cum = be.cumsum(be.nan_to_num(energy[idx]))
+            pos = be.searchsorted(radii_sorted, r_step, side="right")
+            ee = be.where(pos > 0, energy_cum[be.clip(pos - 1, 0, None)], 0.0)
             ax.plot(r_step, ee, label=f"Hx: {field[0]:.3f}, Hy: {field[1]:.3f}")
 
-    def _generate_field_data(
-        self,
-        field,
-        wavelength,
-        num_rays=100,
-        distribution="hexapolar",
-    ):
-        """Generate the field data for a specific field and wavelength.
-
-        Args:
-            field (tuple): Tuple representing the field coordinates.
-            wavelength (float): The wavelength.
-            num_rays (int, optional): The number of rays. Defaults to 100.
-            distribution (str, optional): The distribution of rays.
-                Defaults to 'hexapolar'.
+    def _generate_field_data(self):
+        """Extracts the field data from the most recent ray trace.
 
         Returns:
             list: List of field data, including x, y and energy points.
 
         """
-        self.optic.trace(*field, wavelength, num_rays, distribution)
         x = self.optic.surface_group.x[-1, :]
         y = self.optic.surface_group.y[-1, :]
         intensity = self.optic.surface_group.intensity[-1, :]
@@ -6,10 +6,42 @@ Kramer Harrison, 2024
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
+from numba import njit
 
 import optiland.backend as be
 
 
+@njit(
+    cache=True,
+    error_model="numpy",
+    fastmath={"arcp", "contract", "nsz", "reassoc"},
+)
+def _parabasal_intersection(A, N, u, z):  # pragma: no cover
+    """Compute the intersection of pairs of parabasal rays in a single pass.
+
+    Each row of the input arrays holds one pair of rays. The intersection is
+    found in the plane spanned by the transverse coordinate u (x or y) and z.
+
+    Args:
+        A (numpy.ndarray): Transverse direction cosines (L or M) of the rays.
+        N (numpy.ndarray): The z-components of the ray direction cosines.
+        u (numpy.ndarray): Transverse coordinates (x or y) of the rays.
+        z (numpy.ndarray): The z-coordinates of the rays.
+
+    Returns:
+        numpy.ndarray: The axial distance from the image surface to the
+            intersection point for each pair of rays.
+
+    """
+    out = np.empty(A.shape[0], dtype=np.float64)
+    for i in range(A.shape[0]):
+        num = A[i, 1] * (z[i, 0] - z[i, 1]) - N[i, 1] * (u[i, 0] - u[i, 1])
+        den = A[i, 0] * N[i, 1] - A[i, 1] * N[i, 0]
+        out[i] = num / den * N[i, 0]
+    return out
+
+
 class FieldCurvature:
     """Represents a class for analyzing field curvature of an optic.
 
@@ -118,19 +150,20 @@ class FieldCurvature:
 
         self.optic.trace_generic(Hx, Hy, Px, Py, wavelength=wavelength)
 
-        M1 = self.optic.surface_group.M[-1, ::2]
-        N1 = self.optic.surface_group.N[-1, ::2]
+        # reshape so that each row holds one pair of parabasal rays
+        shape = (self.num_points, 2)
+        M = be.reshape(self.optic.surface_group.M[-1], shape)
+        N = be.reshape(self.optic.surface_group.N[-1], shape)
+        y = be.reshape(self.optic.surface_group.y[-1], shape)
+        z = be.reshape(self.optic.surface_group.z[-1], shape)
 
-        M2 = self.optic.surface_group.M[-1, 1::2]
-        N2 = self.optic.surface_group.N[-1, 1::2]
+        if be.get_backend() == "numpy":
+            return _parabasal_intersection(M, N, y, z)
 
-        y01 = self.optic.surface_group.y[-1, ::2]
-        z01 = self.optic.surface_group.z[-1, ::2]
+        M1, M2 = M[:, 0], M[:, 1]
+        N1, N2 = N[:, 0], N[:, 1]
 
-        y02 = self.optic.surface_group.y[-1, 1::2]
-        z02 = self.optic.surface_group.z[-1, 1::2]
-
-        t1 = (M2 * z01 - M2 * z02 - N2 * y01 + N2 * y02) / (M1 * N2 - M2 * N1)
+        t1 = (M2 * (z[:, 0] - z[:, 1]) - N2 * (y[:, 0] - y[:, 1])) / (M1 * N2 - M2 * N1)
 
         return t1 * N1
 
@@ -154,18 +187,19 @@ class FieldCurvature:
 
         self.optic.trace_generic(Hx, Hy, Px, Py, wavelength=wavelength)
 
-        L1 = self.optic.surface_group.L[-1, ::2]
-        N1 = self.optic.surface_group.N[-1, ::2]
-
-        L2 = self.optic.surface_group.L[-1, 1::2]
-        N2 = self.optic.surface_group.N[-1, 1::2]
+        # reshape so that each row holds one pair of parabasal rays
+        shape = (self.num_points, 2)
+        L = be.reshape(self.optic.surface_group.L[-1], shape)
+        N = be.reshape(self.optic.surface_group.N[-1], shape)
+        x = be.reshape(self.optic.surface_group.x[-1], shape)
+        z = be.reshape(self.optic.surface_group.z[-1], shape)
 
-        x01 = self.optic.surface_group.x[-1, ::2]
-        z01 = self.optic.surface_group.z[-1, ::2]
+        if be.get_backend() == "numpy":
+            return _parabasal_intersection(L, N, x, z)
 
-        x02 = self.optic.surface_group.x[-1, 1::2]
-        z02 = self.optic.surface_group.z[-1, 1::2]
+        L1, L2 = L[:, 0], L[:, 1]
+        N1, N2 = N[:, 0], N[:, 1]
 
-        t2 = (L2 * z01 - L2 * z02 - N2 * x01 + N2 * x02) / (L1 * N2 - L2 * N1)
+        t2 = (L2 * (z[:, 0] - z[:, 1]) - N2 * (x[:, 0] - x[:, 1])) / (L1 * N2 - L2 * N1)
 
         return t2 * N1
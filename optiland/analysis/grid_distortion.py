@@ -96,18 +96,16 @@ class GridDistortion:
         extent = be.linspace(-max_field, max_field, self.num_points)
         Hx, Hy = be.meshgrid(extent, extent)
 
+        rad_max = be.radians(self.optic.fields.max_field)
+
         if self.distortion_type == "f-tan":
-            const = self.optic.surface_group.y[-1, 0] / (
-                be.tan(1e-10 * be.radians(self.optic.fields.max_field))
-            )
-            xp = const * be.tan(Hx * be.radians(self.optic.fields.max_field))
-            yp = const * be.tan(Hy * be.radians(self.optic.fields.max_field))
+            const = self.optic.surface_group.y[-1, 0] / be.tan(1e-10 * rad_max)
+            xp = const * be.tan(Hx * rad_max)
+            yp = const * be.tan(Hy * rad_max)
         elif self.distortion_type == "f-theta":
-            const = self.optic.surface_group.y[-1, 0] / (
-                1e-10 * be.radians(self.optic.fields.max_field)
-            )
-            xp = const * Hx * be.radians(self.optic.fields.max_field)
-            yp = const * Hy * be.radians(self.optic.fields.max_field)
+            const = self.optic.surface_group.y[-1, 0] / (1e-10 * rad_max)
+            xp = const * Hx * rad_max
+            yp = const * Hy * rad_max
         else:
             raise ValueError(
                 '''Distortion type must be "f-tan" or
@@ -139,8 +137,8 @@ class GridDistortion:
         data["yp"] = yp
 
         # Find max distortion
-        delta = be.sqrt((data["xp"] - data["xr"]) ** 2 + (data["yp"] - data["yr"]) ** 2)
-        rp = be.sqrt(data["xp"] ** 2 + data["yp"] ** 2)
+        delta = be.hypot(data["xp"] - data["xr"], data["yp"] - data["yr"])
+        rp = be.hypot(data["xp"], data["yp"])
 
         data["max_distortion"] = be.max(100 * delta / rp)
 
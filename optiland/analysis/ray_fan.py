@@ -27,7 +27,9 @@ class RayFan:
         fields (list): The fields being analyzed.
         wavelengths (list): The wavelengths being analyzed.
         num_points (int): The number of points in the ray fan.
-        data (dict): The generated ray fan data.
+        data (dict): The generated ray fan data, with per-field and
+            per-wavelength arrays of shape (num_fields, num_wavelengths,
+            num_points).
 
     Methods:
         view(figsize=(10, 3.33)): Displays the ray fan plot.
@@ -72,17 +74,13 @@ class RayFan:
         Px = self.data["Px"]
         Py = self.data["Py"]
 
-        for k, field in enumerate(self.fields):
-            for wavelength in self.wavelengths:
-                ex = self.data[f"{field}"][f"{wavelength}"]["x"]
-                i_x = self.data[f"{field}"][f"{wavelength}"]["intensity_x"]
-                ex[i_x == 0] = be.nan
-
-                ey = self.data[f"{field}"][f"{wavelength}"]["y"]
-                i_y = self.data[f"{field}"][f"{wavelength}"]["intensity_y"]
-                ey[i_y == 0] = be.nan
+        # rays that do not reach the image plane are not plotted
+        ex = be.where(self.data["intensity_x"] == 0, be.nan, self.data["ex"])
+        ey = be.where(self.data["intensity_y"] == 0, be.nan, self.data["ey"])
 
-                axs[k, 0].plot(Py, ey, zorder=3, label=f"{wavelength:.4f} µm")
+        for k, field in enumerate(self.fields):
+            for j, wavelength in enumerate(self.wavelengths):
+                axs[k, 0].plot(Py, ey[k, j], zorder=3, label=f"{wavelength:.4f} µm")
                 axs[k, 0].grid()
                 axs[k, 0].axhline(y=0, lw=1, color="gray")
                 axs[k, 0].axvline(x=0, lw=1, color="gray")
@@ -91,7 +89,7 @@ class RayFan:
                 axs[k, 0].set_xlim((-1, 1))
                 axs[k, 0].set_title(f"Hx: {field[0]:.3f}, Hy: {field[1]:.3f}")
 
-                axs[k, 1].plot(Px, ex, zorder=3, label=f"{wavelength:.4f} µm")
+                axs[k, 1].plot(Px, ex[k, j], zorder=3, label=f"{wavelength:.4f} µm")
                 axs[k, 1].grid()
                 axs[k, 1].axhline(y=0, lw=1, color="gray")
                 axs[k, 1].axvline(x=0, lw=1, color="gray")
@@ -108,20 +106,21 @@ class RayFan:
         """Generates the ray fan data.
 
         Returns:
-            dict: The generated ray fan data.
+            dict: The generated ray fan data. The pupil coordinates are stored
+                under 'Px' and 'Py'. The transverse ray errors 'ex' and 'ey'
+                and the corresponding intensities 'intensity_x' and
+                'intensity_y' are arrays of shape
+                (num_fields, num_wavelengths, num_points).
 
         """
-        data = {}
-        data["Px"] = be.linspace(-1, 1, self.num_points)
-        data["Py"] = be.linspace(-1, 1, self.num_points)
-        for field in self.fields:
-            Hx = field[0]
-            Hy = field[1]
-
-            data[f"{field}"] = {}
-            for wavelength in self.wavelengths:
-                data[f"{field}"][f"{wavelength}"] = {}
-
+        shape = (len(self.fields), len(self.wavelengths), self.num_points)
+        ex = be.empty(shape)
+        ey = be.empty(shape)
+        intensity_x = be.empty(shape)
+        intensity_y = be.empty(shape)
+
+        for i, (Hx, Hy) in enumerate(self.fields):
+            for j, wavelength in enumerate(self.wavelengths):
                 self.optic.trace(
                     Hx=Hx,
                     Hy=Hy,
@@ -129,12 +128,8 @@ class RayFan:
                     num_rays=self.num_points,
                     distribution="line_x",
                 )
-                data[f"{field}"][f"{wavelength}"]["x"] = self.optic.surface_group.x[
-                    -1, :
-                ]
-                data[f"{field}"][f"{wavelength}"]["intensity_x"] = (
-                    self.optic.surface_group.intensity[-1, :]
-                )
+                ex[i, j] = self.optic.surface_group.x[-1, :]
+                intensity_x[i, j] = self.optic.surface_group.intensity[-1, :]
 
                 self.optic.trace(
                     Hx=Hx,
@@ -143,20 +138,20 @@ class RayFan:
                     num_rays=self.num_points,
                     distribution="line_y",
                 )
-                data[f"{field}"][f"{wavelength}"]["y"] = self.optic.surface_group.y[
-                    -1, :
-                ]
-                data[f"{field}"][f"{wavelength}"]["intensity_y"] = (
-                    self.optic.surface_group.intensity[-1, :]
-                )
+                ey[i, j] = self.optic.surface_group.y[-1, :]
+                intensity_y[i, j] = self.optic.surface_group.intensity[-1, :]
 
         # remove distortion
-        wave_ref = self.optic.primary_wavelength
-        for field in self.fields:
-            x_offset = data[f"{field}"][f"{wave_ref}"]["x"][self.num_points // 2]
-            y_offset = data[f"{field}"][f"{wave_ref}"]["y"][self.num_points // 2]
-            for wavelength in self.wavelengths:
-                data[f"{field}"][f"{wavelength}"]["x"] -= x_offset
-                data[f"{field}"][f"{wavelength}"]["y"] -= y_offset
-
-        return data
+        ref = list(self.wavelengths).index(self.optic.primary_wavelength)
+        center = self.num_points // 2
+        ex -= be.copy(ex[:, ref, center])[:, None, None]
+        ey -= be.copy(ey[:, ref, center])[:, None, None]
+
+        return {
+            "Px": be.linspace(-1, 1, self.num_points),
+            "Py": be.linspace(-1, 1, self.num_points),
+            "ex": ex,
+            "ey": ey,
+            "intensity_x": intensity_x,
+            "intensity_y": intensity_y,
+        }
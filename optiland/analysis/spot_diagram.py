@@ -5,12 +5,14 @@ This module provides a spot diagram analysis for optical systems.
 Kramer Harrison, 2024
 """
 
-from copy import deepcopy
+from copy import copy
+from functools import cached_property
 
 import matplotlib.pyplot as plt
 from matplotlib import patches
 
 import optiland.backend as be
+from optiland.distribution import create_distribution
 
 
 class SpotDiagram:
@@ -26,9 +28,10 @@ class SpotDiagram:
         fields (tuple): fields at which data is generated
         wavelengths (tuple[float]): wavelengths at which data is generated
         num_rings (int): number of rings in pupil distribution for ray tracing
-        data (List): contains spot data in a nested list. Data is ordered as
+        data (ndarray): contains spot data in an array of shape
+            (num_fields, num_wavelengths, 3, num_rays). Data is ordered as
             field (dim 0), wavelength (dim 1), then x, y and intensity data
-            (dim 2).
+            (dim 2), with one entry per ray (dim 3).
 
     """
 
@@ -79,6 +82,17 @@ class SpotDiagram:
             distribution,
         )
 
+    @cached_property
+    def _centroids(self):
+        """ndarray: Centroid of each field, computed once on first use."""
+        return be.array(self.centroid())
+
+    @cached_property
+    def _centered_data(self):
+        """ndarray: Spot data centered on the field centroids, computed once
+        on first use."""
+        return self._center_spots(self.data)
+
     def view(self, figsize=(12, 4), add_airy_disk=False):
         """View the spot diagram
 
@@ -104,13 +118,13 @@ class SpotDiagram:
         axs = axs.flatten()
 
         # Subtract centroid and find limits
-        data = self._center_spots(deepcopy(self.data))
+        data = self._centered_data
         geometric_size = self.geometric_spot_radius()
         axis_lim = be.max(geometric_size)
 
         if add_airy_disk:
             wavelength = self.optic.wavelengths.primary_wavelength.value
-            centroids = self.centroid()
+            centroids = self._centroids
             chief_ray_centers = self.generate_chief_rays_centers(wavelength=wavelength)
             airy_rad_x, airy_rad_y = self.airy_disc_x_y(wavelength=wavelength)
 
@@ -358,70 +372,52 @@ class SpotDiagram:
         """Centroid of each spot
 
         Returns:
-            centroid (List): centroid for each field in the data.
+            centroid (ndarray): centroid (x, y) for each field in the data,
+                with shape (num_fields, 2).
 
         """
         norm_index = self.optic.wavelengths.primary_index
-        centroid = []
-        for field_data in self.data:
-            centroid_x = be.mean(field_data[norm_index][0])
-            centroid_y = be.mean(field_data[norm_index][1])
-            centroid.append((centroid_x, centroid_y))
-        return centroid
+        return be.mean(self.data[:, norm_index, :2, :], axis=-1)
 
     def geometric_spot_radius(self):
         """Geometric spot radius of each spot
 
         Returns:
-            geometric_size (List): Geometric spot radius for field and
-                wavelength
+            geometric_size (ndarray): Geometric spot radius for each field
+                and wavelength, with shape (num_fields, num_wavelengths).
 
         """
-        data = self._center_spots(deepcopy(self.data))
-        geometric_size = []
-        for field_data in data:
-            geometric_size_field = []
-            for wave_data in field_data:
-                r = be.sqrt(wave_data[0] ** 2 + wave_data[1] ** 2)
-                geometric_size_field.append(be.max(r))
-            geometric_size.append(geometric_size_field)
-        return geometric_size
+        data = self._centered_data
+        r = be.hypot(data[..., 0, :], data[..., 1, :])
+        return be.max(r, axis=-1)
 
     def rms_spot_radius(self):
         """Root mean square (RMS) spot radius of each spot
 
         Returns:
-            rms (List): RMS spot radius for each field and wavelength.
+            rms (ndarray): RMS spot radius for each field and wavelength,
+                with shape (num_fields, num_wavelengths).
 
         """
-        data = self._center_spots(deepcopy(self.data))
-        rms = []
-        for field_data in data:
-            rms_field = []
-            for wave_data in field_data:
-                r2 = wave_data[0] ** 2 + wave_data[1] ** 2
-                rms_field.append(be.sqrt(be.mean(r2)))
-            rms.append(rms_field)
-        return rms
+        data = self._centered_data
+        r2 = data[..., 0, :] ** 2 + data[..., 1, :] ** 2
+        return be.sqrt(be.mean(r2, axis=-1))
 
     def _center_spots(self, data):
         """Centers the spots in the given data around their respective centroids.
 
         Args:
-            data (List): A nested list representing the data containing spots.
+            data (ndarray): An array of spot data with shape
+                (num_fields, num_wavelengths, 3, num_rays).
 
         Returns:
-            data (List): A nested list with the spots centered around their
-                centroids.
+            data (ndarray): A new array with the spots centered around their
+                centroids. The input data is not modified.
 
         """
-        centroids = self.centroid()
-        data = deepcopy(self.data)
-        for i, field_data in enumerate(data):
-            for wave_data in field_data:
-                wave_data[0] -= centroids[i][0]
-                wave_data[1] -= centroids[i][1]
-        return data
+        centered = be.copy(data)
+        centered[:, :, :2, :] -= self._centroids[:, None, :, None]
+        return centered
 
     def _generate_data(
         self,
@@ -437,51 +433,58 @@ class SpotDiagram:
             wavelengths (List): A list of wavelengths.
             num_rays (int, optional): The number of rays to generate.
                 Defaults to 100.
-            distribution (str, optional): The distribution type.
-                Defaults to 'hexapolar'.
+            distribution (str or BaseDistribution, optional): The
+                distribution type. Defaults to 'hexapolar'.
 
         Returns:
-            data (List): A nested list of spot intersection data for each
-                field and wavelength.
+            data (ndarray): An array of spot intersection data with shape
+                (num_fields, num_wavelengths, 3, num_rays).
 
         """
-        data = []
-        for field in fields:
-            field_data = []
-            for wavelength in wavelengths:
-                field_data.append(
-                    self._generate_field_data(
-                        field, wavelength, num_rays, distribution
-                    ),
-                )
-            data.append(field_data)
-        return data
-
-    def _generate_field_data(
-        self,
-        field,
-        wavelength,
-        num_rays=100,
-        distribution="hexapolar",
-    ):
-        """Generates spot data for a given field and wavelength.
+        if isinstance(distribution, str):
+            distribution = create_distribution(distribution)
+            distribution.generate_points(num_rays)
+
+        num_fields = len(fields)
+        num_wavelengths = len(wavelengths)
+        num_pupil = be.size(distribution.x)
+
+        # Trace all fields and wavelengths in a single batch. Rays are ordered
+        # by field, then wavelength, then pupil coordinate.
+        fields = be.array(fields)
+        Hx = be.repeat(fields[:, 0], num_wavelengths * num_pupil)
+        Hy = be.repeat(fields[:, 1], num_wavelengths * num_pupil)
+        wavelength = be.tile(
+            be.repeat(be.array(wavelengths), num_pupil),
+            num_fields,
+        )
 
-        Args:
-            field (tuple): Tuple containing the field coordinates in (x, y).
-            wavelength (float): The wavelength of the field.
-            num_rays (int, optional): The number of rays to generate.
-                Defaults to 100.
-            distribution (str, optional): The distribution pattern of the
-                rays. Defaults to 'hexapolar'.
+        pupil = copy(distribution)
+        pupil.x = be.tile(distribution.x, num_fields * num_wavelengths)
+        pupil.y = be.tile(distribution.y, num_fields * num_wavelengths)
+
+        self.optic.trace(Hx, Hy, wavelength, distribution=pupil)
+
+        shape = (num_fields, num_wavelengths, num_pupil)
+        x, y, intensity = self._generate_field_data()
+        return be.stack(
+            [
+                be.reshape(x, shape),
+                be.reshape(y, shape),
+                be.reshape(intensity, shape),
+            ],
+            axis=2,
+        )
+
+    def _generate_field_data(self):
+        """Extracts spot data from the most recent ray trace.
 
         Returns:
             list: A list containing the local x-coordinates,
                 local y-coordinates, and intensity values of the
-                generated spot data.
+                traced rays on the image surface.
 
         """
-        self.optic.trace(*field, wavelength, num_rays, distribution)
-
         # Extract the global intersection coordinates from the image
         # surface (i.e. final surface)
 
@@ -8,6 +8,9 @@ Kramer Harrison, 2024
 """
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+import optiland.backend as be
 
 
 class YYbar:
@@ -45,19 +48,25 @@ class YYbar:
         ya = ya.flatten()
         yb = yb.flatten()
 
-        for k in range(2, len(ya)):
-            label = ""
-            if k == 2:
-                label = "Surface 1"
-            elif k == len(ya) - 1:
-                label = "Image"
-            ax.plot(
-                [yb[k - 1], yb[k]],
-                [ya[k - 1], ya[k]],
-                ".-",
-                label=label,
-                markersize=8,
-            )
+        # each segment connects consecutive surfaces, starting at surface 1
+        points = be.stack([yb[1:], ya[1:]], axis=-1)
+        segments = be.stack([points[:-1], points[1:]], axis=1)
+        colors = [f"C{k}" for k in range(len(segments))]
+
+        ax.add_collection(LineCollection(segments, colors=colors))
+        ax.scatter(
+            points[:, 0],
+            points[:, 1],
+            s=64,
+            marker=".",
+            c=colors + colors[-1:],
+            zorder=3,
+        )
+        ax.autoscale_view()
+
+        # legend entries only
+        ax.plot([], [], ".-", color=colors[0], markersize=8, label="Surface 1")
+        ax.plot([], [], ".-", color=colors[-1], markersize=8, label="Image")
 
         ax.axhline(y=0, linewidth=0.5, color="k")
         ax.axvline(x=0, linewidth=0.5, color="k")
@@ -118,7 +118,7 @@ class FieldGroup:
     @property
     def max_field(self):
         """be.array: max field in radial coordinates"""
-        return be.max(be.sqrt(self.x_fields**2 + self.y_fields**2))
+        return be.max(be.hypot(self.x_fields, self.y_fields))
 
     @property
     def num_fields(self):
@@ -19,6 +19,10 @@ class BaseGeometry(ABC):
 
     _registry = {}
 
+    # True for geometries whose sag is identically zero, allowing callers
+    # to skip evaluating the sag entirely
+    sag_is_zero = False
+
     def __init__(self, coordinate_system):
         self.cs = coordinate_system
 
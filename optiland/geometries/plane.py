@@ -7,13 +7,33 @@ always defined in the local coordinate system of the geometry.
 Kramer Harrison, 2024
 """
 
-import warnings
+import numpy as np
+from numba import njit
 
 import optiland.backend as be
 from optiland.coordinate_system import CoordinateSystem
 from optiland.geometries.base import BaseGeometry
 
 
+@njit(cache=True, error_model="numpy")
+def _plane_distance(z, N):  # pragma: no cover
+    """Compute the propagation distance -z / N to the plane z = 0 in a single
+    pass over the ray arrays.
+
+    Args:
+        z (numpy.ndarray): The z-coordinates of the rays.
+        N (numpy.ndarray): The z-components of the ray direction cosines.
+
+    Returns:
+        numpy.ndarray: The propagation distance for each ray.
+
+    """
+    t = np.empty(z.size, dtype=np.float64)
+    for i in range(z.size):
+        t[i] = -z[i] / N[i]
+    return t
+
+
 class Plane(BaseGeometry):
     """An infinite plane geometry.
 
@@ -22,6 +42,8 @@ class Plane(BaseGeometry):
 
     """
 
+    sag_is_zero = True
+
     def __init__(self, coordinate_system):
         super().__init__(coordinate_system)
         self.radius = be.inf
@@ -59,11 +81,10 @@ class Plane(BaseGeometry):
                 each ray.
 
         """
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            t = -rays.z / rays.N
+        if be.get_backend() == "numpy":
+            return _plane_distance(rays.z, rays.N)
 
-        return t
+        return -rays.z / rays.N
 
     def surface_normal(self, rays):
         """Find the surface normal of the plane geometry at the given points.
@@ -102,7 +102,7 @@ class ZernikePolynomialGeometry(NewtonRaphsonGeometry):
         self._validate_inputs(x_norm, y_norm)
 
         # Convert to local polar
-        rho = be.sqrt(x_norm**2 + y_norm**2)
+        rho = be.hypot(x_norm, y_norm)
         theta = be.arctan2(y_norm, x_norm)
 
         # Base conic
@@ -265,7 +265,7 @@ class ZernikePolynomialGeometry(NewtonRaphsonGeometry):
         # Now add partial derivatives from the Zernike expansions
         x_norm = x / self.norm_radius
         y_norm = y / self.norm_radius
-        rho = be.sqrt(x_norm**2 + y_norm**2)
+        rho = be.hypot(x_norm, y_norm)
         theta = be.arctan2(y_norm, x_norm)
 
         # Chain rule:
@@ -151,7 +151,7 @@ class GeometricMTF(SpotDiagram):
             Ac = be.sum(A * be.cos(2 * be.pi * v[k] * x) * dx) / be.sum(A * dx)
             As = be.sum(A * be.sin(2 * be.pi * v[k] * x) * dx) / be.sum(A * dx)
 
-            mtf[k] = be.sqrt(Ac**2 + As**2)
+            mtf[k] = be.hypot(Ac, As)
 
         return mtf * scale_factor
 
@@ -10,8 +10,11 @@ system.
 Kramer Harrison, 2023
 """
 
+from functools import cached_property
+
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
+import scipy.fft as sfft
 from matplotlib.colors import LogNorm
 from scipy.ndimage import zoom
 
@@ -36,7 +39,7 @@ class FFTPSF(Wavefront):
         grid_size (int): The size of the grid used for computing the PSF.
         pupils (list): The list of pupil functions, as generated by
             wavefront.Wavefront.
-        psf (ndarray): The computed PSFs.
+        psf (ndarray): The computed PSF, in single precision.
 
     Methods:
         view(projection='2d', log=False, figsize=(7, 5.5), threshold=0.05,
@@ -102,7 +105,7 @@ class FFTPSF(Wavefront):
             float: The Strehl ratio.
 
         """
-        return self.psf[self.grid_size // 2, self.grid_size // 2] / 100
+        return float(self.psf[self.grid_size // 2, self.grid_size // 2] / 100)
 
     def _plot_2d(self, image, log, x_extent, y_extent, figsize=(7, 5.5)):
         """Plot the PSF in 2d.
@@ -217,20 +220,20 @@ class FFTPSF(Wavefront):
         """Generate the pupils for each wavelength. Utilizes wavefront.Wavefront.
 
         Returns:
-            list: A list of complex arrays representing the pupils for each
-                wavelength.
+            list: A list of single-precision complex arrays representing the
+                pupils for each wavelength.
 
         """
         x = be.linspace(-1, 1, self.num_rays)
         x, y = be.meshgrid(x, x)
         x = x.ravel()
         y = y.ravel()
-        R = be.sqrt(x**2 + y**2)
+        R = be.hypot(x, y)
 
         pupils = []
 
         for k in range(len(self.wavelengths)):
-            P = be.zeros_like(x, dtype=complex)
+            P = be.zeros_like(x, dtype=be.complex64)
             amplitude = self.data[0][k][1] / be.mean(self.data[0][k][1])
             P[R <= 1] = amplitude * be.exp(1j * 2 * be.pi * self.data[0][k][0])
             P = be.reshape(P, (self.num_rays, self.num_rays))
@@ -247,15 +250,16 @@ class FFTPSF(Wavefront):
         """
         # TODO: add ability to compute polychromatic PSF.
         # Interpolate for each wavelength, then incoherently sum.
-        pupils = self._pad_pupils()
         norm_factor = self._get_normalization()
 
-        psf = []
-        for pupil in pupils:
-            amp = be.fft.fftshift(be.fft.fft2(pupil))
-            psf.append(amp * be.conj(amp))
+        psf = be.zeros((self.grid_size, self.grid_size), dtype=be.float32)
+        buffer = be.zeros((self.grid_size, self.grid_size), dtype=be.complex64)
+        for pupil in self._pad_pupils(buffer):
+            amp = sfft.fft2(pupil, workers=-1, overwrite_x=True)
+            psf += amp.real**2 + amp.imag**2
 
-        return be.real(be.sum(psf, axis=0)) / norm_factor * 100
+        # shift once after the incoherent sum rather than once per wavelength
+        return sfft.fftshift(psf) / norm_factor * 100
 
     def _interpolate_psf(self, image, n=128):
         """Interpolates the point spread function (PSF) of an image. Used for
@@ -270,9 +274,9 @@ class FFTPSF(Wavefront):
             numpy.ndarray: The interpolated PSF grid.
 
         """
-        zoom_factor = n / image.shape[0]
+        zoom_factor = (n / image.shape[0], n / image.shape[1])
 
-        if zoom_factor == 1:
+        if zoom_factor == (1, 1):
             return image
         return zoom(image, zoom_factor, order=3)
 
@@ -290,12 +294,15 @@ class FFTPSF(Wavefront):
 
         """
         thresholded_psf = self.psf > threshold
-        non_zero_indices = be.argwhere(thresholded_psf)
-
-        try:
-            min_x, min_y = be.min(non_zero_indices, axis=0)
-            max_x, max_y = be.max(non_zero_indices, axis=0)
-        except ValueError:
+        rows = be.any(thresholded_psf, axis=1)
+        cols = be.any(thresholded_psf, axis=0)
+
+        if be.any(rows):
+            min_x = int(be.argmax(rows))
+            max_x = len(rows) - 1 - int(be.argmax(rows[::-1]))
+            min_y = int(be.argmax(cols))
+            max_y = len(cols) - 1 - int(be.argmax(cols[::-1]))
+        else:
             min_x, min_y = 0, 0
             max_x, max_y = self.psf.shape
 
@@ -315,24 +322,27 @@ class FFTPSF(Wavefront):
 
         return int(min_x), int(min_y), int(max_x), int(max_y)
 
-    def _pad_pupils(self):
+    def _pad_pupils(self, buffer):
         """Pad the pupils with zeros to match the grid size.
 
-        Returns:
-            list: A list of padded pupils.
+        The pupils are written one at a time into the center of the given
+        buffer, so each yielded array is only valid until the next one is
+        requested.
+
+        Args:
+            buffer (be.ndarray): A complex (grid_size, grid_size) array that
+                is overwritten with each padded pupil.
+
+        Yields:
+            be.ndarray: The padded pupil for each wavelength.
 
         """
-        pupils_padded = []
         for pupil in self.pupils:
-            pad = (self.grid_size - pupil.shape[0]) // 2
-            pupil = be.pad(
-                pupil,
-                ((pad, pad), (pad, pad)),
-                mode="constant",
-                constant_values=0,
-            )
-            pupils_padded.append(pupil)
-        return pupils_padded
+            n = pupil.shape[0]
+            pad = (self.grid_size - n) // 2
+            buffer.fill(0)
+            buffer[pad : pad + n, pad : pad + n] = pupil
+            yield buffer
 
     def _get_normalization(self):
         """Calculate the normalization factor for the Point Spread Function (PSF).
@@ -341,12 +351,23 @@ class FFTPSF(Wavefront):
             float: The normalization factor for the PSF.
 
         """
-        P_nom = self.pupils[0].copy()
-        P_nom[P_nom != 0] = 1
+        # The nominal pupil is a non-negative real mask, so the peak of its
+        # squared FFT magnitude is the DC term, i.e. the squared pupil area.
+        P_nom = self.pupils[0] != 0
+        return float(be.sum(P_nom)) ** 2 * len(self.pupils)
+
+    @cached_property
+    def _working_FNO(self):
+        """float: Working F-number of the optic, computed once on first use."""
+        FNO = self.optic.paraxial.FNO()
+
+        if not self.optic.object_surface.is_infinite:
+            D = self.optic.paraxial.XPD()
+            p = D / self.optic.paraxial.EPD()
+            m = self.optic.paraxial.magnification()
+            FNO *= 1 + be.abs(m) / p
 
-        amp_norm = be.fft.fftshift(be.fft.fft2(P_nom))
-        psf_norm = amp_norm * be.conj(amp_norm)
-        return be.real(be.max(psf_norm) * len(self.pupils))
+        return FNO
 
     def _get_psf_units(self, image):
         """Calculate the physical units of the point spread function (PSF) based
@@ -363,16 +384,8 @@ class FFTPSF(Wavefront):
             https://www.strollswithmydog.com/wavefront-to-psf-to-mtf-physical-units/#iv
 
         """
-        FNO = self.optic.paraxial.FNO()
-
-        if not self.optic.object_surface.is_infinite:
-            D = self.optic.paraxial.XPD()
-            p = D / self.optic.paraxial.EPD()
-            m = self.optic.paraxial.magnification()
-            FNO *= 1 + be.abs(m) / p
-
         Q = self.grid_size / self.num_rays
-        dx = self.wavelengths[0] * FNO / Q
+        dx = self.wavelengths[0] * self._working_FNO / Q
 
         x = image.shape[1] * dx
         y = image.shape[0] * dx
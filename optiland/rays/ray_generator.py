@@ -132,7 +132,9 @@ class RayGenerator:
             if self.optic.field_type == "object_height":
                 x = field_x
                 y = field_y
-                z = obj.geometry.sag(x, y) + obj.geometry.cs.z
+                z = obj.geometry.cs.z
+                if not obj.geometry.sag_is_zero:
+                    z = obj.geometry.sag(x, y) + z
 
             elif self.optic.field_type == "angle":
                 EPL = self.optic.paraxial.EPL()
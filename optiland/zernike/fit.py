@@ -62,7 +62,7 @@ class ZernikeFit:
         self.type = zernike_type
         self.num_terms = num_terms
 
-        self.radius = np.sqrt(self.x**2 + self.y**2)
+        self.radius = np.hypot(self.x, self.y)
         self.phi = np.arctan2(self.y, self.x)
         self.num_pts = np.size(self.z)
 
@@ -107,7 +107,7 @@ class ZernikeFit:
             np.linspace(-1, 1, num_points),
             np.linspace(-1, 1, num_points),
         )
-        radius = np.sqrt(x**2 + y**2)
+        radius = np.hypot(x, y)
         phi = np.arctan2(y, x)
         z = self.zernike.poly(radius, phi)
 
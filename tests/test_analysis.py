@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import matplotlib
 import matplotlib.pyplot as plt
@@ -165,6 +165,40 @@ class TestCookeTripletEncircledEnergy:
         mock_show.assert_called_once()
         plt.close()
 
+    def test_encircled_energy_curve(self, cooke_triplet):
+        encircled_energy = analysis.EncircledEnergy(cooke_triplet, num_rays=100)
+
+        axis_lim = 1.0
+        num_points = 64
+        r_step = be.linspace(0, axis_lim * 1.2, num_points)
+
+        rng = be.random.default_rng(0)
+        x = rng.uniform(-1, 1, 500)
+        y = rng.uniform(-1, 1, 500)
+        energy = rng.uniform(0, 1, 500)
+
+        # radii exactly on an r_step value, NaN radii and NaN energies
+        x[:10] = r_step[::7][:10]
+        y[:10] = 0.0
+        x[10:20] = be.nan
+        energy[20:30] = be.nan
+
+        ax = MagicMock()
+        encircled_energy._plot_field(
+            ax,
+            [(x, y, energy)],
+            (0.0, 0.0),
+            axis_lim,
+            num_points,
+        )
+
+        radii = be.hypot(x, y)
+        expected = [be.nansum(energy[radii <= r]) for r in r_step]
+
+        r_plot, ee = ax.plot.call_args[0]
+        assert be.array_equal(r_plot, r_step)
+        assert be.allclose(ee, expected, rtol=0, atol=1e-10)
+
 
 class TestCookeTripletRayFan:
     def test_ray_fan(self, cooke_triplet):
@@ -176,155 +210,155 @@ class TestCookeTripletRayFan:
         assert fan.data["Py"][0] == -1
         assert fan.data["Py"][-1] == 1
 
-        assert fan.data["(0.0, 0.0)"]["0.48"]["x"][0] == pytest.approx(
+        assert fan.data["ex"][0, 0, 0] == pytest.approx(
             0.00238814980958324,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.0)"]["0.48"]["x"][-1] == pytest.approx(
+        assert fan.data["ex"][0, 0, -1] == pytest.approx(
             -0.00238814980958324,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.0)"]["0.48"]["y"][0] == pytest.approx(
+        assert fan.data["ey"][0, 0, 0] == pytest.approx(
             0.00238814980958324,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.0)"]["0.48"]["y"][-1] == pytest.approx(
+        assert fan.data["ey"][0, 0, -1] == pytest.approx(
             -0.00238814980958324,
             abs=1e-9,
         )
 
-        assert fan.data["(0.0, 0.0)"]["0.55"]["x"][0] == pytest.approx(
+        assert fan.data["ex"][0, 1, 0] == pytest.approx(
             0.004195677081323623,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.0)"]["0.55"]["x"][-1] == pytest.approx(
+        assert fan.data["ex"][0, 1, -1] == pytest.approx(
             -0.004195677081323623,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.0)"]["0.55"]["y"][0] == pytest.approx(
+        assert fan.data["ey"][0, 1, 0] == pytest.approx(
             0.004195677081323623,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.0)"]["0.55"]["y"][-1] == pytest.approx(
+        assert fan.data["ey"][0, 1, -1] == pytest.approx(
             -0.004195677081323623,
             abs=1e-9,
         )
 
-        assert fan.data["(0.0, 0.0)"]["0.65"]["x"][0] == pytest.approx(
+        assert fan.data["ex"][0, 2, 0] == pytest.approx(
             -8.284696919602652e-06,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.0)"]["0.65"]["x"][-1] == pytest.approx(
+        assert fan.data["ex"][0, 2, -1] == pytest.approx(
             8.284696919602652e-06,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.0)"]["0.65"]["y"][0] == pytest.approx(
+        assert fan.data["ey"][0, 2, 0] == pytest.approx(
             -8.284696919602652e-06,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.0)"]["0.65"]["y"][-1] == pytest.approx(
+        assert fan.data["ey"][0, 2, -1] == pytest.approx(
             8.284696919602652e-06,
             abs=1e-9,
         )
 
-        assert fan.data["(0.0, 0.7)"]["0.48"]["x"][0] == pytest.approx(
+        assert fan.data["ex"][1, 0, 0] == pytest.approx(
             0.01973142095198721,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.7)"]["0.48"]["x"][-1] == pytest.approx(
+        assert fan.data["ex"][1, 0, -1] == pytest.approx(
             -0.01973142095198721,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.7)"]["0.48"]["y"][0] == pytest.approx(
+        assert fan.data["ey"][1, 0, 0] == pytest.approx(
             -0.023207115035676296,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.7)"]["0.48"]["y"][-1] == pytest.approx(
+        assert fan.data["ey"][1, 0, -1] == pytest.approx(
             0.03928464835618861,
             abs=1e-9,
         )
 
-        assert fan.data["(0.0, 0.7)"]["0.55"]["x"][0] == pytest.approx(
+        assert fan.data["ex"][1, 1, 0] == pytest.approx(
             0.021420191179537973,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.7)"]["0.55"]["x"][-1] == pytest.approx(
+        assert fan.data["ex"][1, 1, -1] == pytest.approx(
             -0.021420191179537973,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.7)"]["0.55"]["y"][0] == pytest.approx(
+        assert fan.data["ey"][1, 1, 0] == pytest.approx(
             -0.024812371459915994,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.7)"]["0.55"]["y"][-1] == pytest.approx(
+        assert fan.data["ey"][1, 1, -1] == pytest.approx(
             0.04075295155640113,
             abs=1e-9,
         )
 
-        assert fan.data["(0.0, 0.7)"]["0.65"]["x"][0] == pytest.approx(
+        assert fan.data["ex"][1, 2, 0] == pytest.approx(
             0.017025487217305013,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.7)"]["0.65"]["x"][-1] == pytest.approx(
+        assert fan.data["ex"][1, 2, -1] == pytest.approx(
             -0.017025487217305013,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.7)"]["0.65"]["y"][0] == pytest.approx(
+        assert fan.data["ey"][1, 2, 0] == pytest.approx(
             -0.03229666187094615,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 0.7)"]["0.65"]["y"][-1] == pytest.approx(
+        assert fan.data["ey"][1, 2, -1] == pytest.approx(
             0.047721942006075935,
             abs=1e-9,
         )
 
-        assert fan.data["(0.0, 1.0)"]["0.48"]["x"][0] == pytest.approx(
+        assert fan.data["ex"][2, 0, 0] == pytest.approx(
             0.01563881685548374,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 1.0)"]["0.48"]["x"][-1] == pytest.approx(
+        assert fan.data["ex"][2, 0, -1] == pytest.approx(
             -0.01563881685548374,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 1.0)"]["0.48"]["y"][0] == pytest.approx(
+        assert fan.data["ey"][2, 0, 0] == pytest.approx(
             -0.0044989771745065354,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 1.0)"]["0.48"]["y"][-1] == pytest.approx(
+        assert fan.data["ey"][2, 0, -1] == pytest.approx(
             0.013000385049824814,
             abs=1e-9,
         )
 
-        assert fan.data["(0.0, 1.0)"]["0.55"]["x"][0] == pytest.approx(
+        assert fan.data["ex"][2, 1, 0] == pytest.approx(
             0.016936433773790505,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 1.0)"]["0.55"]["x"][-1] == pytest.approx(
+        assert fan.data["ex"][2, 1, -1] == pytest.approx(
             -0.016936433773790505,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 1.0)"]["0.55"]["y"][0] == pytest.approx(
+        assert fan.data["ey"][2, 1, 0] == pytest.approx(
             -0.01705141007843025,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 1.0)"]["0.55"]["y"][-1] == pytest.approx(
+        assert fan.data["ey"][2, 1, -1] == pytest.approx(
             0.022501847359645666,
             abs=1e-9,
         )
 
-        assert fan.data["(0.0, 1.0)"]["0.65"]["x"][0] == pytest.approx(
+        assert fan.data["ex"][2, 2, 0] == pytest.approx(
             0.01214534602206907,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 1.0)"]["0.65"]["x"][-1] == pytest.approx(
+        assert fan.data["ex"][2, 2, -1] == pytest.approx(
             -0.01214534602206907,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 1.0)"]["0.65"]["y"][0] == pytest.approx(
+        assert fan.data["ey"][2, 2, 0] == pytest.approx(
             -0.033957537601747134,
             abs=1e-9,
         )
-        assert fan.data["(0.0, 1.0)"]["0.65"]["y"][-1] == pytest.approx(
+        assert fan.data["ey"][2, 2, -1] == pytest.approx(
             0.036545592330593735,
             abs=1e-9,
         )
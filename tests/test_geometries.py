@@ -35,6 +35,20 @@ class TestPlane:
         y = be.array([0, -7.0, 2.1654])
         sag = be.array([0.0, 0.0, 0.0])
         assert be.allclose(plane.sag(x, y), sag)
+        assert plane.sag(x, y).shape == y.shape
+
+        # the result is a writable array, as for other geometries
+        z = plane.sag(x, y)
+        z += 1.0
+        assert be.allclose(z, 1.0)
+
+    def test_plane_sag_is_zero(self):
+        cs = CoordinateSystem()
+        plane = geometries.Plane(cs)
+        assert plane.sag_is_zero
+
+        sphere = geometries.StandardGeometry(cs, radius=10.0)
+        assert not sphere.sag_is_zero
 
     def test_plane_distance(self):
         cs = CoordinateSystem()
@@ -165,6 +165,18 @@ def test_interpolate_zoom_factor_one():
     assert fftpsf._interpolate_psf(fftpsf.psf) is fftpsf.psf
 
 
+def test_interpolate_non_square():
+    optic = CookeTriplet()
+    field = (0, 1)
+    wavelength = 0.55
+    num_rays = 128
+    grid_size = 128
+
+    fftpsf = FFTPSF(optic, field, wavelength, num_rays, grid_size)
+    image = fftpsf.psf[32:96, 48:80]
+    assert fftpsf._interpolate_psf(image, n=64).shape == (64, 64)
+
+
 def test_large_threshold():
     optic = CookeTriplet()
     field = (0, 1)
@@ -178,3 +190,22 @@ def test_large_threshold():
     assert min_y == 0
     assert max_x == grid_size
     assert max_y == grid_size
+
+
+def test_get_normalization():
+    optic = CookeTriplet()
+    field = (0, 1)
+    wavelength = 0.55
+    num_rays = 128
+    grid_size = 256
+
+    fftpsf = FFTPSF(optic, field, wavelength, num_rays, grid_size)
+
+    # compare with the peak of the squared FFT of the padded nominal pupil
+    P_nom = (fftpsf.pupils[0] != 0).astype(float)
+    pad = (grid_size - num_rays) // 2
+    P_nom = be.pad(P_nom, ((pad, pad), (pad, pad)))
+    amp_norm = be.fft.fft2(P_nom)
+    expected = be.max(be.abs(amp_norm) ** 2)
+
+    assert fftpsf._get_normalization() == pytest.approx(expected, rel=1e-12)